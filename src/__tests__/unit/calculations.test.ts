@@ -5,16 +5,23 @@
 
 import { describe, it, expect } from "vitest";
 import {
+  getPropertyTransferTaxRate,
   calculateSideCosts,
   calculateInvestmentVolume,
   calculateFinancing,
+  calculateAnnuityPayment,
+  calculateAnnuityPayments,
   calculateAfA,
   calculateTax,
   calculateCashflow,
   calculateYields,
+  calculateYieldsBatch,
   generateAmortizationSchedule,
+  calculateRemainingBalances,
   calculateCumulativeCashflow,
   calculatePropertyKPIs,
+  calculatePropertyKPIsCached,
+  calculatePortfolioSummary,
   getDefaultPropertyInput,
   calculateRentIndex,
   calculateBreakEven,
@@ -23,7 +30,10 @@ import {
   calculateLocationAnalysis,
 } from "@/lib/calculations";
 import { calculateMarketValueDiscount } from "@/lib/utils";
+import { BundeslandData } from "@/types";
 import type {
+  Bundesland,
+  Property,
   PropertyInput,
   RentIndexInput,
   BreakEvenInput,
@@ -100,6 +110,22 @@ describe("calculateSideCosts", () => {
   });
 });
 
+// ===========================================
+// getPropertyTransferTaxRate Tests
+// ===========================================
+describe("getPropertyTransferTaxRate", () => {
+  it("should return the tax rate of every Bundesland", () => {
+    for (const [bundesland, data] of Object.entries(BundeslandData)) {
+      expect(getPropertyTransferTaxRate(bundesland as Bundesland)).toBe(data.taxRate);
+    }
+  });
+
+  it("should return known rates", () => {
+    expect(getPropertyTransferTaxRate("BAYERN")).toBe(3.5);
+    expect(getPropertyTransferTaxRate("NORDRHEIN_WESTFALEN")).toBe(6.5);
+  });
+});
+
 // ===========================================
 // calculateInvestmentVolume Tests
 // ===========================================
@@ -181,6 +207,62 @@ describe("calculateFinancing", () => {
     expect(result.totalInterest).toBeGreaterThan(0);
     expect(result.totalInterest).toBeLessThan((100000 * 4 * 10) / 100);
   });
+
+  it("should match the interest summed over the amortization schedule", () => {
+    const result = calculateFinancing(267210, 3.5, 2.0, 15);
+    const schedule = generateAmortizationSchedule(267210, 3.5, 2.0, 15);
+    const scheduleInterest = schedule.reduce((sum, year) => sum + year.interestPayment, 0);
+
+    expect(result.totalInterest).toBeCloseTo(scheduleInterest, 6);
+  });
+
+  it("should stop charging interest once the loan is paid off", () => {
+    // Paid off in year 9, well before the 20-year period ends
+    const result = calculateFinancing(100000, 3.0, 10.0, 20);
+    const schedule = generateAmortizationSchedule(100000, 3.0, 10.0, 20);
+    const scheduleInterest = schedule.reduce((sum, year) => sum + year.interestPayment, 0);
+
+    expect(schedule.length).toBeLessThan(20);
+    expect(result.totalInterest).toBeCloseTo(scheduleInterest, 6);
+  });
+
+  it("should have no interest at a zero interest rate", () => {
+    const result = calculateFinancing(100000, 0, 5.0, 10);
+
+    expect(result.totalInterest).toBe(0);
+    expect(result.totalCost).toBe(100000);
+  });
+});
+
+// ===========================================
+// calculateAnnuityPayment Tests
+// ===========================================
+describe("calculateAnnuityPayment", () => {
+  it("should apply interest and repayment rate to the loan amount", () => {
+    // Annuity = 267210 * (3.5 + 2.0) / 100 = 14696.55
+    expect(calculateAnnuityPayment(267210, 3.5, 2.0)).toBeCloseTo(14696.55, 2);
+  });
+
+  it("should match the payment used by calculateFinancing", () => {
+    const financing = calculateFinancing(500000, 4.0, 1.0, 10);
+
+    expect(calculateAnnuityPayment(500000, 4.0, 1.0)).toBe(financing.annualPayment);
+  });
+
+  it("should calculate payments for many loans at once", () => {
+    const payments = calculateAnnuityPayments(
+      [100000, 500000, 0],
+      [3.0, 4.0, 3.5],
+      [10.0, 1.0, 2.0]
+    );
+
+    expect(payments).toBeInstanceOf(Float64Array);
+    expect(Array.from(payments)).toEqual([
+      calculateAnnuityPayment(100000, 3.0, 10.0),
+      calculateAnnuityPayment(500000, 4.0, 1.0),
+      0,
+    ]);
+  });
 });
 
 // ===========================================
@@ -507,6 +589,53 @@ describe("calculateYields", () => {
   });
 });
 
+// ===========================================
+// calculateYieldsBatch Tests
+// ===========================================
+describe("calculateYieldsBatch", () => {
+  it("should match calculateYields for each property", () => {
+    const standard = createStandardInput();
+    const noEquity = { ...createStandardInput(), equity: 0 };
+    const outputs = [standard, noEquity].map((input) => calculatePropertyKPIs(input));
+
+    const batch = calculateYieldsBatch({
+      purchasePrice: outputs.map((o) => o.investmentVolume.purchasePrice),
+      totalInvestment: outputs.map((o) => o.investmentVolume.totalInvestment),
+      equity: [standard.equity, noEquity.equity],
+      grossRentalIncome: outputs.map((o) => o.cashflow.grossRentalIncome),
+      netRentalIncome: outputs.map((o) => o.cashflow.netRentalIncome),
+      operatingCosts: outputs.map((o) => o.cashflow.operatingCosts),
+      cashflowAfterTax: outputs.map((o) => o.cashflow.cashflowAfterTax),
+    });
+
+    outputs.forEach((output, index) => {
+      expect(batch.grossRentalYield[index]).toBe(output.yields.grossRentalYield);
+      expect(batch.netRentalYield[index]).toBe(output.yields.netRentalYield);
+      expect(batch.returnOnEquity[index]).toBe(output.yields.returnOnEquity);
+      expect(batch.cashflowYield[index]).toBe(output.yields.cashflowYield);
+      expect(batch.objectYield[index]).toBe(output.yields.objectYield);
+    });
+    expect(batch.returnOnEquity[1]).toBe(0);
+  });
+
+  it("should return zero yields for zero denominators", () => {
+    const batch = calculateYieldsBatch({
+      purchasePrice: [0],
+      totalInvestment: [0],
+      equity: [0],
+      grossRentalIncome: [12000],
+      netRentalIncome: [11000],
+      operatingCosts: [1000],
+      cashflowAfterTax: [500],
+    });
+
+    expect(Array.from(batch.grossRentalYield)).toEqual([0]);
+    expect(Array.from(batch.netRentalYield)).toEqual([0]);
+    expect(Array.from(batch.returnOnEquity)).toEqual([0]);
+    expect(Array.from(batch.cashflowYield)).toEqual([0]);
+  });
+});
+
 // ===========================================
 // generateAmortizationSchedule Tests
 // ===========================================
@@ -565,6 +694,35 @@ describe("generateAmortizationSchedule", () => {
   });
 });
 
+// ===========================================
+// calculateRemainingBalances Tests
+// ===========================================
+describe("calculateRemainingBalances", () => {
+  it("should match the schedule's ending balances for each loan", () => {
+    const loans = [
+      [200000, 3.5, 2.0],
+      [100000, 2.0, 20.0], // paid off before year 10
+      [0, 3.5, 2.0],
+    ];
+    const years = 10;
+
+    const balances = calculateRemainingBalances(
+      loans.map(([loanAmount]) => loanAmount),
+      loans.map(([, interestRate]) => interestRate),
+      loans.map(([, , repaymentRate]) => repaymentRate),
+      years
+    );
+
+    expect(balances).toHaveLength(loans.length * years);
+    loans.forEach(([loanAmount, interestRate, repaymentRate], loan) => {
+      const schedule = generateAmortizationSchedule(loanAmount, interestRate, repaymentRate, years);
+      for (let year = 0; year < years; year++) {
+        expect(balances[loan * years + year]).toBe(schedule[year]?.endingBalance ?? 0);
+      }
+    });
+  });
+});
+
 // ===========================================
 // calculateCumulativeCashflow Tests
 // ===========================================
@@ -605,6 +763,14 @@ describe("calculateCumulativeCashflow", () => {
     expect(result[0].cumulativeCashflow).toBe(-2000);
     expect(result[4].cumulativeCashflow).toBe(-10000);
   });
+
+  it("should compound property value annually from the purchase price", () => {
+    const schedule = generateAmortizationSchedule(200000, 3.5, 2.0, 10);
+    const result = calculateCumulativeCashflow(300000, schedule, 3000, 2.0);
+
+    expect(result[0].propertyValue).toBeCloseTo(306000, 6);
+    expect(result[9].propertyValue).toBeCloseTo(300000 * Math.pow(1.02, 10), 6);
+  });
 });
 
 // ===========================================
@@ -650,6 +816,112 @@ describe("calculatePropertyKPIs", () => {
     expect(output.financing.loanAmount).toBeGreaterThan(input.purchasePrice);
     expect(output.yields.returnOnEquity).toBe(0); // No equity
   });
+
+  it("should use the average annual interest of the schedule as deductible interest", () => {
+    const input = createStandardInput();
+    const output = calculatePropertyKPIs(input);
+
+    const totalInterest = output.amortizationSchedule.reduce(
+      (sum, year) => sum + year.interestPayment,
+      0
+    );
+    const expectedAverage = totalInterest / output.amortizationSchedule.length;
+
+    expect(output.tax.deductibleInterest).toBeCloseTo(expectedAverage, 6);
+  });
+
+  it("should match the standalone schedule and cashflow projection", () => {
+    const input = createStandardInput();
+    const output = calculatePropertyKPIs(input);
+    const loanAmount = output.financing.loanAmount;
+
+    const schedule = generateAmortizationSchedule(
+      loanAmount,
+      input.interestRate,
+      input.repaymentRate,
+      input.fixedInterestPeriod
+    );
+    const projection = calculateCumulativeCashflow(
+      input.purchasePrice,
+      schedule,
+      output.cashflow.cashflowAfterTax,
+      input.expectedAppreciationPercent
+    );
+
+    expect(output.amortizationSchedule).toEqual(schedule);
+    expect(output.cumulativeCashflow).toEqual(projection);
+  });
+
+  it("should reuse the cached output for the same input object", () => {
+    const input = createStandardInput();
+    const output = calculatePropertyKPIsCached(input);
+
+    expect(output).toEqual(calculatePropertyKPIs(input));
+    expect(calculatePropertyKPIsCached(input)).toBe(output);
+    expect(calculatePropertyKPIsCached({ ...input })).not.toBe(output);
+  });
+
+  it("should calculate a new output for a changed copy of a cached input", () => {
+    const input = createStandardInput();
+    const output = calculatePropertyKPIsCached(input);
+
+    const changed = { ...input, purchasePrice: input.purchasePrice + 50000 };
+    const changedOutput = calculatePropertyKPIsCached(changed);
+
+    expect(changedOutput).not.toBe(output);
+    expect(changedOutput).toEqual(calculatePropertyKPIs(changed));
+    expect(changedOutput.investmentVolume.purchasePrice).toBe(input.purchasePrice + 50000);
+    expect(calculatePropertyKPIsCached(input)).toBe(output);
+  });
+});
+
+// ===========================================
+// calculatePortfolioSummary Tests
+// ===========================================
+describe("calculatePortfolioSummary", () => {
+  const createProperty = (id: string, input: PropertyInput, withOutput: boolean): Property => ({
+    id,
+    name: id,
+    createdAt: new Date(0),
+    updatedAt: new Date(0),
+    input,
+    output: withOutput ? calculatePropertyKPIs(input) : undefined,
+  });
+
+  it("should return zeros for an empty portfolio", () => {
+    const summary = calculatePortfolioSummary([]);
+
+    expect(summary.totalProperties).toBe(0);
+    expect(summary.totalInvestment).toBe(0);
+    expect(summary.averageYield).toBe(0);
+  });
+
+  it("should aggregate stored and calculated outputs", () => {
+    const first = createStandardInput();
+    const second = { ...createStandardInput(), purchasePrice: 200000, equity: 40000 };
+    const firstOutput = calculatePropertyKPIs(first);
+    const secondOutput = calculatePropertyKPIs(second);
+
+    const summary = calculatePortfolioSummary([
+      createProperty("a", first, true),
+      createProperty("b", second, false),
+    ]);
+
+    const totalInvestment =
+      firstOutput.investmentVolume.totalInvestment + secondOutput.investmentVolume.totalInvestment;
+    expect(summary.totalProperties).toBe(2);
+    expect(summary.totalInvestment).toBeCloseTo(totalInvestment, 6);
+    expect(summary.totalEquity).toBe(first.equity + second.equity);
+    expect(summary.totalDebt).toBeCloseTo(totalInvestment - first.equity - second.equity, 6);
+    expect(summary.totalAnnualCashflow).toBeCloseTo(
+      firstOutput.cashflow.cashflowAfterTax + secondOutput.cashflow.cashflowAfterTax,
+      6
+    );
+    expect(summary.averageYield).toBeCloseTo(
+      (firstOutput.yields.grossRentalYield + secondOutput.yields.grossRentalYield) / 2,
+      6
+    );
+  });
 });
 
 // ===========================================
@@ -0,0 +1,47 @@
+/**
+ * Tests for Monte Carlo analytics helpers
+ */
+
+import { describe, it, expect } from "vitest";
+import { generateHistogramData } from "@/lib/analytics/monte-carlo";
+
+describe("generateHistogramData", () => {
+  it("should put all values into the last bin when they are equal", () => {
+    const histogram = generateHistogramData([5000, 5000, 5000], 4);
+
+    expect(histogram.map((bin) => bin.count)).toEqual([0, 0, 0, 3]);
+    expect(histogram[3].percentage).toBe(100);
+  });
+
+  it("should count values on bin edges into the bin starting at that edge", () => {
+    const histogram = generateHistogramData([0, 10, 20, 30, 40], 4);
+
+    // Bins are [start, end); the last bin also includes the maximum
+    expect(histogram.map((bin) => bin.count)).toEqual([1, 1, 1, 2]);
+  });
+
+  it("should match the bin edge comparisons for inexact floating-point edges", () => {
+    const values = Array.from({ length: 11 }, (_, i) => i / 10);
+    const bins = 10;
+    const binWidth = (1 - 0) / bins;
+
+    const histogram = generateHistogramData(values, bins);
+
+    const expected = Array.from({ length: bins }, (_, i) => {
+      const binStart = i * binWidth;
+      const binEnd = (i + 1) * binWidth;
+      return values.filter((v) => v >= binStart && (i === bins - 1 ? v <= 1 : v < binEnd)).length;
+    });
+    expect(histogram.map((bin) => bin.count)).toEqual(expected);
+  });
+
+  it("should count every value exactly once", () => {
+    const values = Array.from({ length: 1000 }, (_, i) => 100000 + Math.sin(i) * 50000);
+
+    const histogram = generateHistogramData(values);
+
+    expect(histogram).toHaveLength(20);
+    expect(histogram.reduce((sum, bin) => sum + bin.count, 0)).toBe(values.length);
+    expect(histogram.reduce((sum, bin) => sum + bin.percentage, 0)).toBeCloseTo(100, 10);
+  });
+});
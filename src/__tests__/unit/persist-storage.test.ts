@@ -0,0 +1,110 @@
+/**
+ * Tests for the store's localStorage persistence adapter
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+import { persistStorage, useImmoCalcStore } from "@/store";
+import { getDefaultPropertyInput } from "@/lib/calculations";
+import type { Property } from "@/types";
+
+const STORAGE_NAME = "persist-storage-test";
+
+function createProperty(id: string): Property {
+  return {
+    id,
+    name: `Immobilie ${id}`,
+    createdAt: new Date("2024-01-01T00:00:00.000Z"),
+    updatedAt: new Date("2024-01-02T00:00:00.000Z"),
+    input: getDefaultPropertyInput(),
+  };
+}
+
+describe("persistStorage", () => {
+  beforeEach(() => {
+    localStorage.removeItem(STORAGE_NAME);
+  });
+
+  it("should write the same JSON as JSON.stringify and read it back", () => {
+    const value = {
+      state: { properties: [createProperty("a")], currentInput: getDefaultPropertyInput() },
+      version: 0,
+    };
+
+    persistStorage.setItem(STORAGE_NAME, value);
+
+    const stored = localStorage.getItem(STORAGE_NAME);
+    expect(stored).toBe(JSON.stringify(value));
+    expect(persistStorage.getItem(STORAGE_NAME)).toEqual(JSON.parse(JSON.stringify(value)));
+  });
+
+  it("should stay in sync when only the input or only the properties change", () => {
+    const properties = [createProperty("a")];
+    const first = {
+      state: { properties, currentInput: getDefaultPropertyInput() },
+      version: 0,
+    };
+    persistStorage.setItem(STORAGE_NAME, first);
+
+    // Same properties array (cached JSON is reused), new input
+    const second = {
+      state: { properties, currentInput: { ...first.state.currentInput, purchasePrice: 123456 } },
+      version: 0,
+    };
+    persistStorage.setItem(STORAGE_NAME, second);
+    expect(localStorage.getItem(STORAGE_NAME)).toBe(JSON.stringify(second));
+
+    // New properties array
+    const third = {
+      state: { ...second.state, properties: [...properties, createProperty("b")] },
+      version: 0,
+    };
+    persistStorage.setItem(STORAGE_NAME, third);
+    expect(localStorage.getItem(STORAGE_NAME)).toBe(JSON.stringify(third));
+  });
+
+  it("should serialize every persisted field, not only the known ones", () => {
+    const value = {
+      state: {
+        properties: [createProperty("a")],
+        currentInput: getDefaultPropertyInput(),
+        activeTab: "portfolio",
+        skipped: undefined,
+      },
+      version: 1,
+    };
+
+    persistStorage.setItem(STORAGE_NAME, value);
+
+    expect(localStorage.getItem(STORAGE_NAME)).toBe(JSON.stringify(value));
+  });
+
+  describe("when storage access is blocked", () => {
+    beforeEach(() => {
+      vi.spyOn(window, "localStorage", "get").mockImplementation(() => {
+        throw new DOMException("The operation is insecure.", "SecurityError");
+      });
+    });
+
+    afterEach(() => {
+      vi.restoreAllMocks();
+    });
+
+    it("should skip persistence instead of throwing", () => {
+      const value = {
+        state: { properties: [createProperty("a")], currentInput: getDefaultPropertyInput() },
+        version: 0,
+      };
+
+      expect(() => persistStorage.setItem(STORAGE_NAME, value)).not.toThrow();
+      expect(persistStorage.getItem(STORAGE_NAME)).toBeNull();
+      expect(() => persistStorage.removeItem(STORAGE_NAME)).not.toThrow();
+    });
+
+    it("should keep input updates working", () => {
+      const { updateInput } = useImmoCalcStore.getState();
+
+      expect(() => updateInput({ purchasePrice: 250000 })).not.toThrow();
+      expect(useImmoCalcStore.getState().currentInput.purchasePrice).toBe(250000);
+    });
+  });
+});
@@ -7,7 +7,6 @@ import { Tabs, TabsList, TabsTrigger, TabsContent } from "@/components/ui/tabs";
 import { Button } from "@/components/ui/button";
 import { BottomNavigation } from "@/components/ui/bottom-navigation";
 import { ToastProvider } from "@/components/ui/toast";
-import { Onboarding } from "@/components/ui/onboarding";
 import { PresetButton } from "@/components/ui/preset-selector";
 import { SkipLink } from "@/components/ui/skip-link";
 import { ThemeToggle } from "@/components/theme";
@@ -129,6 +128,13 @@ const DueDiligenceChecklist = dynamic(
   }
 );
 
+// Onboarding (with coach marks and preset picker) is only shown to first-time users
+// and renders nothing on the server, so keep it out of the initial bundle
+const Onboarding = dynamic(
+  () => import("@/components/ui/onboarding").then((mod) => ({ default: mod.Onboarding })),
+  { ssr: false }
+);
+
 export default function Home() {
   const { activeTab, setActiveTab, resetInput, clearInput, calculate } = useImmoCalcStore();
   const [isHeaderCollapsed, setIsHeaderCollapsed] = useState(false);
@@ -5,7 +5,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Slider } from "@/components/ui/slider";
 import { Button } from "@/components/ui/button";
 import { useImmoCalcStore } from "@/store";
-import { calculateBreakEven, calculatePropertyKPIs } from "@/lib/calculations";
+import { calculateBreakEven, calculatePropertyKPIsCached } from "@/lib/calculations";
 import { formatCurrency } from "@/lib/utils";
 import { BreakEvenResult } from "@/types";
 import { Target, Clock, TrendingUp, Calculator, PiggyBank } from "lucide-react";
@@ -33,7 +33,7 @@ const helpTexts = {
 
 export function BreakEvenCalculator() {
   const { currentInput } = useImmoCalcStore();
-  const output = calculatePropertyKPIs(currentInput);
+  const output = calculatePropertyKPIsCached(currentInput);
 
   const [appreciationRate, setAppreciationRate] = useState(2.0);
   const [sellingCostsPercent, setSellingCostsPercent] = useState(6.0);
@@ -4,8 +4,9 @@ import React from "react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { useImmoCalcStore } from "@/store";
 import { useTheme } from "@/components/theme";
-import { calculatePropertyKPIs } from "@/lib/calculations";
+import { calculatePropertyKPIsCached } from "@/lib/calculations";
 import { formatCurrency } from "@/lib/utils";
+import type { AmortizationYear } from "@/types";
 import {
   BarChart,
   Bar,
@@ -25,7 +26,7 @@ import { BarChart3, TrendingUp, TrendingDown } from "lucide-react";
 interface ChartTooltipProps {
   active?: boolean;
   payload?: Array<{ color: string; name: string; value: number; dataKey?: string }>;
-  label?: string;
+  label?: number;
 }
 
 function ChartTooltip({ active, payload, label }: ChartTooltipProps) {
@@ -33,7 +34,7 @@ function ChartTooltip({ active, payload, label }: ChartTooltipProps) {
     return (
       <div className="animate-fade-in rounded-lg border border-slate-200/50 bg-white/95 p-4 shadow-xl backdrop-blur-md dark:border-slate-700/50 dark:bg-slate-800/95">
         <p className="mb-3 border-b border-slate-200 pb-2 font-semibold text-slate-900 dark:border-slate-700 dark:text-white">
-          {label}
+          {label !== undefined && formatYearLabel(label)}
         </p>
         <div className="space-y-1.5">
           {payload.map((entry, index) => (
@@ -60,33 +61,80 @@ function ChartTooltip({ active, payload, label }: ChartTooltipProps) {
 /** Number of years between data points on the amortization chart */
 const CHART_YEAR_INTERVAL = 5;
 
+// Static chart props shared by both charts. Defined once so Recharts receives
+// stable references instead of fresh objects/functions on every render.
+const CHART_MARGIN = { top: 20, right: 30, left: 20, bottom: 5 };
+const LEGEND_WRAPPER_STYLE = { paddingTop: "20px" };
+const BAR_RADIUS: [number, number, number, number] = [6, 6, 0, 0];
+const BAR_TOOLTIP_CURSOR = { fill: "rgba(100, 116, 139, 0.1)" };
+
+// Theme-aware colors and the axis props derived from them, built once per theme
+const CHART_THEME_COLORS = {
+  light: { grid: "#e2e8f0", axis: "#64748b", referenceLine: "#94a3b8" },
+  dark: { grid: "#334155", axis: "#94a3b8", referenceLine: "#64748b" },
+};
+
+const CHART_AXIS_PROPS = {
+  light: {
+    tick: { fontSize: 12, fill: CHART_THEME_COLORS.light.axis },
+    axisLine: { stroke: CHART_THEME_COLORS.light.grid, strokeOpacity: 0.5 },
+  },
+  dark: {
+    tick: { fontSize: 12, fill: CHART_THEME_COLORS.dark.axis },
+    axisLine: { stroke: CHART_THEME_COLORS.dark.grid, strokeOpacity: 0.5 },
+  },
+};
+
+/** Delay (ms) before charts re-measure and re-layout after their container resizes */
+const CHART_RESIZE_DEBOUNCE_MS = 150;
+
+function toAmortizationPoint(year: AmortizationYear) {
+  return {
+    year: year.year,
+    Restschuld: Math.round(year.endingBalance),
+    Getilgt: Math.round(year.cumulativePrincipal),
+  };
+}
+
+function formatYearLabel(year: number): string {
+  return `Jahr ${year}`;
+}
+
+function formatThousands(value: number): string {
+  return `${(value / 1000).toFixed(0)}k`;
+}
+
+function renderLegendLabel(value: string) {
+  return <span className="text-sm font-medium text-slate-600 dark:text-slate-300">{value}</span>;
+}
+
 export function AmortizationChart() {
   const { currentInput } = useImmoCalcStore();
   const { resolvedTheme } = useTheme();
-  const output = calculatePropertyKPIs(currentInput);
-  const isDark = resolvedTheme === "dark";
-
-  // Theme-aware colors
-  const gridColor = isDark ? "#334155" : "#e2e8f0";
-  const axisColor = isDark ? "#94a3b8" : "#64748b";
+  const output = calculatePropertyKPIsCached(currentInput);
+  const theme = resolvedTheme === "dark" ? "dark" : "light";
+  const colors = CHART_THEME_COLORS[theme];
+  const axisProps = CHART_AXIS_PROPS[theme];
 
   // Select key years for chart (every CHART_YEAR_INTERVAL years)
-  const chartData = output.amortizationSchedule
-    .filter(
-      (year, index) =>
-        index % CHART_YEAR_INTERVAL === 0 || index === output.amortizationSchedule.length - 1
-    )
-    .map((year) => ({
-      year: `Jahr ${year.year}`,
-      Restschuld: Math.round(year.endingBalance),
-      Getilgt: Math.round(year.cumulativePrincipal),
-      Zinsen: Math.round(year.cumulativeInterest),
-    }));
+  // Memoized so theme changes and unrelated re-renders don't rebuild the series
+  const schedule = output.amortizationSchedule;
+  const chartData = React.useMemo(() => {
+    const data: ReturnType<typeof toAmortizationPoint>[] = [];
+    const lastIndex = schedule.length - 1;
+    // Single pass over the schedule: visit sampled years directly instead of filter + map
+    for (let index = 0; index <= lastIndex; index += CHART_YEAR_INTERVAL) {
+      data.push(toAmortizationPoint(schedule[index]));
+    }
+    if (lastIndex > 0 && lastIndex % CHART_YEAR_INTERVAL !== 0) {
+      data.push(toAmortizationPoint(schedule[lastIndex]));
+    }
+    return data;
+  }, [schedule]);
 
-  const finalBalance =
-    output.amortizationSchedule[output.amortizationSchedule.length - 1]?.endingBalance || 0;
-  const totalPrincipal =
-    output.amortizationSchedule[output.amortizationSchedule.length - 1]?.cumulativePrincipal || 0;
+  const lastYear = schedule[schedule.length - 1];
+  const finalBalance = lastYear?.endingBalance || 0;
+  const totalPrincipal = lastYear?.cumulativePrincipal || 0;
 
   return (
     <Card className="overflow-hidden" animate>
@@ -100,8 +148,8 @@ export function AmortizationChart() {
       </CardHeader>
       <CardContent className="pt-6">
         <div className="chart-animate-in h-[300px] md:h-[400px]">
-          <ResponsiveContainer width="100%" height="100%">
-            <BarChart data={chartData} margin={{ top: 20, right: 30, left: 20, bottom: 5 }}>
+          <ResponsiveContainer width="100%" height="100%" debounce={CHART_RESIZE_DEBOUNCE_MS}>
+            <BarChart data={chartData} margin={CHART_MARGIN}>
               <defs>
                 <linearGradient id="restschuldGradient" x1="0" y1="0" x2="0" y2="1">
                   <stop offset="0%" stopColor="#f87171" stopOpacity={0.9} />
@@ -115,41 +163,38 @@ export function AmortizationChart() {
                   <feDropShadow dx="0" dy="2" stdDeviation="3" floodOpacity="0.1" />
                 </filter>
               </defs>
-              <CartesianGrid strokeDasharray="3 3" stroke={gridColor} strokeOpacity={0.5} />
+              <CartesianGrid strokeDasharray="3 3" stroke={colors.grid} strokeOpacity={0.5} />
               <XAxis
                 dataKey="year"
-                tick={{ fontSize: 12, fill: axisColor }}
+                tickFormatter={formatYearLabel}
+                tick={axisProps.tick}
                 tickLine={false}
-                axisLine={{ stroke: gridColor, strokeOpacity: 0.5 }}
+                axisLine={axisProps.axisLine}
               />
               <YAxis
-                tickFormatter={(value) => `${(value / 1000).toFixed(0)}k`}
-                tick={{ fontSize: 12, fill: axisColor }}
+                tickFormatter={formatThousands}
+                tick={axisProps.tick}
                 tickLine={false}
                 axisLine={false}
               />
-              <Tooltip content={<ChartTooltip />} cursor={{ fill: "rgba(100, 116, 139, 0.1)" }} />
+              <Tooltip content={<ChartTooltip />} cursor={BAR_TOOLTIP_CURSOR} />
               <Legend
-                wrapperStyle={{ paddingTop: "20px" }}
+                wrapperStyle={LEGEND_WRAPPER_STYLE}
                 iconType="circle"
-                formatter={(value) => (
-                  <span className="text-sm font-medium text-slate-600 dark:text-slate-300">
-                    {value}
-                  </span>
-                )}
+                formatter={renderLegendLabel}
               />
               <Bar
                 dataKey="Restschuld"
                 name="Restschuld"
                 fill="url(#restschuldGradient)"
-                radius={[6, 6, 0, 0]}
+                radius={BAR_RADIUS}
                 filter="url(#barShadow)"
               />
               <Bar
                 dataKey="Getilgt"
                 name="Getilgter Betrag"
                 fill="url(#getilgtGradient)"
-                radius={[6, 6, 0, 0]}
+                radius={BAR_RADIUS}
                 filter="url(#barShadow)"
               />
             </BarChart>
@@ -185,25 +230,25 @@ export function AmortizationChart() {
 export function CumulativeCashflowChart() {
   const { currentInput } = useImmoCalcStore();
   const { resolvedTheme } = useTheme();
-  const output = calculatePropertyKPIs(currentInput);
-  const isDark = resolvedTheme === "dark";
-
-  // Theme-aware colors
-  const gridColor = isDark ? "#334155" : "#e2e8f0";
-  const axisColor = isDark ? "#94a3b8" : "#64748b";
-  const referenceLineColor = isDark ? "#64748b" : "#94a3b8";
+  const output = calculatePropertyKPIsCached(currentInput);
+  const theme = resolvedTheme === "dark" ? "dark" : "light";
+  const colors = CHART_THEME_COLORS[theme];
+  const axisProps = CHART_AXIS_PROPS[theme];
 
-  const chartData = output.cumulativeCashflow.map((point) => ({
-    year: `Jahr ${point.year}`,
-    Cashflow: Math.round(point.cumulativeCashflow),
-    Nettovermögen: Math.round(point.netWorth),
-    Immobilienwert: Math.round(point.propertyValue),
-  }));
+  const chartData = React.useMemo(
+    () =>
+      output.cumulativeCashflow.map((point) => ({
+        year: point.year,
+        Cashflow: Math.round(point.cumulativeCashflow),
+        Nettovermögen: Math.round(point.netWorth),
+        Immobilienwert: Math.round(point.propertyValue),
+      })),
+    [output.cumulativeCashflow]
+  );
 
-  const finalCashflow =
-    output.cumulativeCashflow[output.cumulativeCashflow.length - 1]?.cumulativeCashflow || 0;
-  const finalNetWorth =
-    output.cumulativeCashflow[output.cumulativeCashflow.length - 1]?.netWorth || 0;
+  const lastPoint = output.cumulativeCashflow[output.cumulativeCashflow.length - 1];
+  const finalCashflow = lastPoint?.cumulativeCashflow || 0;
+  const finalNetWorth = lastPoint?.netWorth || 0;
 
   return (
     <Card className="overflow-hidden" animate>
@@ -219,8 +264,8 @@ export function CumulativeCashflowChart() {
       </CardHeader>
       <CardContent className="pt-6">
         <div className="chart-animate-in h-[300px] md:h-[400px]">
-          <ResponsiveContainer width="100%" height="100%">
-            <AreaChart data={chartData} margin={{ top: 20, right: 30, left: 20, bottom: 5 }}>
+          <ResponsiveContainer width="100%" height="100%" debounce={CHART_RESIZE_DEBOUNCE_MS}>
+            <AreaChart data={chartData} margin={CHART_MARGIN}>
               <defs>
                 <linearGradient id="cashflowGradient" x1="0" y1="0" x2="0" y2="1">
                   <stop offset="0%" stopColor="#6366f1" stopOpacity={0.3} />
@@ -239,32 +284,29 @@ export function CumulativeCashflowChart() {
                   <stop offset="100%" stopColor="#14b8a6" />
                 </linearGradient>
               </defs>
-              <CartesianGrid strokeDasharray="3 3" stroke={gridColor} strokeOpacity={0.5} />
+              <CartesianGrid strokeDasharray="3 3" stroke={colors.grid} strokeOpacity={0.5} />
               <XAxis
                 dataKey="year"
-                tick={{ fontSize: 12, fill: axisColor }}
+                tickFormatter={formatYearLabel}
+                tick={axisProps.tick}
                 tickLine={false}
-                axisLine={{ stroke: gridColor, strokeOpacity: 0.5 }}
+                axisLine={axisProps.axisLine}
               />
               <YAxis
-                tickFormatter={(value) => `${(value / 1000).toFixed(0)}k`}
-                tick={{ fontSize: 12, fill: axisColor }}
+                tickFormatter={formatThousands}
+                tick={axisProps.tick}
                 tickLine={false}
                 axisLine={false}
               />
               <Tooltip content={<ChartTooltip />} />
               <Legend
-                wrapperStyle={{ paddingTop: "20px" }}
+                wrapperStyle={LEGEND_WRAPPER_STYLE}
                 iconType="circle"
-                formatter={(value) => (
-                  <span className="text-sm font-medium text-slate-600 dark:text-slate-300">
-                    {value}
-                  </span>
-                )}
+                formatter={renderLegendLabel}
               />
               <ReferenceLine
                 y={0}
-                stroke={referenceLineColor}
+                stroke={colors.referenceLine}
                 strokeDasharray="3 3"
                 strokeOpacity={0.5}
               />
@@ -5,7 +5,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Slider } from "@/components/ui/slider";
 import { Button } from "@/components/ui/button";
 import { useImmoCalcStore } from "@/store";
-import { calculateExitStrategy, calculatePropertyKPIs } from "@/lib/calculations";
+import { calculateExitStrategy, calculatePropertyKPIsCached } from "@/lib/calculations";
 import { formatCurrency } from "@/lib/utils";
 import { ExitStrategyResult } from "@/types";
 import { LogOut, Calculator, AlertTriangle, TrendingUp, Clock, Wallet, Scale } from "lucide-react";
@@ -32,7 +32,7 @@ const helpTexts = {
 
 export function ExitStrategyCalculator() {
   const { currentInput } = useImmoCalcStore();
-  const output = calculatePropertyKPIs(currentInput);
+  const output = calculatePropertyKPIsCached(currentInput);
 
   const [holdingPeriod, setHoldingPeriod] = useState(10);
   const [appreciationRate, setAppreciationRate] = useState(2.0);
@@ -42,11 +42,8 @@ export function ExitStrategyCalculator() {
   const currentValue =
     output.investmentVolume.totalInvestment * Math.pow(1 + appreciationRate / 100, holdingPeriod);
 
-  // Calculate remaining debt based on amortization
-  const remainingDebt =
-    holdingPeriod <= output.amortizationSchedule.length
-      ? output.amortizationSchedule[holdingPeriod - 1]?.endingBalance || 0
-      : 0;
+  // Calculate remaining debt based on amortization (paid off beyond the schedule's end)
+  const remainingDebt = output.amortizationSchedule[holdingPeriod - 1]?.endingBalance ?? 0;
 
   // Calculate cumulative cashflow
   const cumulativeCashflow = output.cashflow.cashflowAfterTax * holdingPeriod;
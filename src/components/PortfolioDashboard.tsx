@@ -1,10 +1,11 @@
 "use client";
 
-import React, { useState } from "react";
+import React, { useMemo, useState } from "react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { useImmoCalcStore } from "@/store";
+import { calculatePortfolioSummary } from "@/lib/calculations";
 import { formatCurrency } from "@/lib/utils";
 import {
   Building2,
@@ -19,7 +20,6 @@ import {
 export function PortfolioDashboard() {
   const {
     properties,
-    getPortfolioSummary,
     saveProperty,
     loadProperty,
     deleteProperty,
@@ -30,7 +30,9 @@ export function PortfolioDashboard() {
   const [propertyName, setPropertyName] = useState("");
   const [propertyAddress, setPropertyAddress] = useState("");
 
-  const summary = getPortfolioSummary();
+  // The store re-renders this view on every input change; the summary only depends on
+  // the saved properties, so it is aggregated again only when they change
+  const summary = useMemo(() => calculatePortfolioSummary(properties), [properties]);
 
   const handleSave = () => {
     if (propertyName.trim()) {
@@ -15,6 +15,7 @@ import {
 import { useImmoCalcStore } from "@/store";
 import { BundeslandData, Bundesland, AfARates, AfAType } from "@/types";
 import { formatCurrency, calculateMarketValueDiscount } from "@/lib/utils";
+import { getPropertyTransferTaxRate } from "@/lib/calculations";
 import {
   Building2,
   Banknote,
@@ -244,10 +245,9 @@ export function PropertyCalculatorForm() {
 
   const handleBundeslandChange = (value: string) => {
     const bundesland = value as Bundesland;
-    const taxRate = BundeslandData[bundesland].taxRate;
     updateInput({
       bundesland: bundesland,
-      propertyTransferTaxPercent: taxRate,
+      propertyTransferTaxPercent: getPropertyTransferTaxRate(bundesland),
     });
   };
 
@@ -8,8 +8,9 @@ import { ProgressIndicator } from "@/components/ui/trend-indicator";
 import { Gauge } from "@/components/ui/gauge";
 import { SwipeableCards } from "@/components/ui/swipeable-cards";
 import { useImmoCalcStore } from "@/store";
+import { useMediaQuery } from "@/lib/hooks";
 import { formatCurrency, calculateMarketValueDiscount } from "@/lib/utils";
-import { calculatePropertyKPIs } from "@/lib/calculations";
+import { calculatePropertyKPIsCached } from "@/lib/calculations";
 import { PropertyOutput } from "@/types";
 import {
   TrendingUp,
@@ -430,7 +431,9 @@ const secondaryMetricsRowClasses =
 
 export function ResultsPanel() {
   const { currentInput } = useImmoCalcStore();
-  const output = calculatePropertyKPIs(currentInput);
+  const output = calculatePropertyKPIsCached(currentInput);
+  // null until mounted: render both layouts (CSS picks one), then only the visible one
+  const isDesktop = useMediaQuery("(min-width: 768px)");
 
   const isPositiveCashflow = output.cashflow.cashflowAfterTax >= 0;
   const isTaxSaving = output.tax.taxEffect > 0;
@@ -595,20 +598,24 @@ export function ResultsPanel() {
       )}
 
       {/* Swipeable Cards for Mobile */}
-      <div className="md:hidden">
-        <SwipeableCards showArrows={true} showDots={true}>
+      {isDesktop !== true && (
+        <div className="md:hidden">
+          <SwipeableCards showArrows={true} showDots={true}>
+            <YieldMetricsContent output={output} />
+            <TaxOverviewContent output={output} isTaxSaving={isTaxSaving} />
+            <SideCostsContent output={output} />
+          </SwipeableCards>
+        </div>
+      )}
+
+      {/* Desktop: Stacked Layout */}
+      {isDesktop !== false && (
+        <div className="hidden space-y-6 md:block">
           <YieldMetricsContent output={output} />
           <TaxOverviewContent output={output} isTaxSaving={isTaxSaving} />
           <SideCostsContent output={output} />
-        </SwipeableCards>
-      </div>
-
-      {/* Desktop: Stacked Layout */}
-      <div className="hidden space-y-6 md:block">
-        <YieldMetricsContent output={output} />
-        <TaxOverviewContent output={output} isTaxSaving={isTaxSaving} />
-        <SideCostsContent output={output} />
-      </div>
+        </div>
+      )}
     </div>
   );
 }
@@ -5,7 +5,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { useImmoCalcStore } from "@/store";
-import { calculatePropertyKPIs } from "@/lib/calculations";
+import { calculatePropertyKPIsCached } from "@/lib/calculations";
 import { formatCurrency } from "@/lib/utils";
 import { Plus, Trash2, GitCompare } from "lucide-react";
 
@@ -23,7 +23,14 @@ export function ScenarioComparison() {
     }
   };
 
-  const currentOutput = calculatePropertyKPIs(currentInput);
+  const currentOutput = calculatePropertyKPIsCached(currentInput);
+
+  // Resolve each scenario's output once instead of once per table row
+  const scenarioOutputs = React.useMemo(
+    () =>
+      scenarios.map((scenario) => scenario.output || calculatePropertyKPIsCached(scenario.input)),
+    [scenarios]
+  );
 
   return (
     <div className="space-y-6">
@@ -178,8 +185,8 @@ export function ScenarioComparison() {
                     <td className="px-2 py-2 text-right font-medium text-blue-600 dark:text-blue-400">
                       {formatCurrency(currentOutput.financing.monthlyPayment)}
                     </td>
-                    {scenarios.map((scenario) => {
-                      const output = scenario.output || calculatePropertyKPIs(scenario.input);
+                    {scenarios.map((scenario, index) => {
+                      const output = scenarioOutputs[index];
                       return (
                         <td
                           key={scenario.id}
@@ -203,8 +210,8 @@ export function ScenarioComparison() {
                     >
                       {formatCurrency(currentOutput.cashflow.monthlyCashflowAfterTax)}
                     </td>
-                    {scenarios.map((scenario) => {
-                      const output = scenario.output || calculatePropertyKPIs(scenario.input);
+                    {scenarios.map((scenario, index) => {
+                      const output = scenarioOutputs[index];
                       return (
                         <td
                           key={scenario.id}
@@ -226,8 +233,8 @@ export function ScenarioComparison() {
                     <td className="px-2 py-2 text-right font-medium text-blue-600 dark:text-blue-400">
                       {currentOutput.yields.returnOnEquity.toFixed(2)}%
                     </td>
-                    {scenarios.map((scenario) => {
-                      const output = scenario.output || calculatePropertyKPIs(scenario.input);
+                    {scenarios.map((scenario, index) => {
+                      const output = scenarioOutputs[index];
                       return (
                         <td
                           key={scenario.id}
@@ -245,8 +252,8 @@ export function ScenarioComparison() {
                     <td className="px-2 py-2 text-right font-medium text-blue-600 dark:text-blue-400">
                       {formatCurrency(currentOutput.financing.loanAmount)}
                     </td>
-                    {scenarios.map((scenario) => {
-                      const output = scenario.output || calculatePropertyKPIs(scenario.input);
+                    {scenarios.map((scenario, index) => {
+                      const output = scenarioOutputs[index];
                       return (
                         <td
                           key={scenario.id}
@@ -92,32 +92,38 @@ const SMART_TIPS: SmartTip[] = [
   },
 ];
 
+/**
+ * Class names per tip type
+ */
+const TIP_TYPE_STYLES: Record<
+  SmartTip["type"],
+  { container: string; icon: string; title: string; message: string }
+> = {
+  info: {
+    container: "border-blue-200 bg-blue-50 dark:border-blue-800 dark:bg-blue-950/50",
+    icon: "text-blue-500 dark:text-blue-400",
+    title: "text-blue-900 dark:text-blue-100",
+    message: "text-blue-700 dark:text-blue-300",
+  },
+  warning: {
+    container: "border-amber-200 bg-amber-50 dark:border-amber-800 dark:bg-amber-950/50",
+    icon: "text-amber-500 dark:text-amber-400",
+    title: "text-amber-900 dark:text-amber-100",
+    message: "text-amber-700 dark:text-amber-300",
+  },
+  success: {
+    container: "border-green-200 bg-green-50 dark:border-green-800 dark:bg-green-950/50",
+    icon: "text-green-500 dark:text-green-400",
+    title: "text-green-900 dark:text-green-100",
+    message: "text-green-700 dark:text-green-300",
+  },
+};
+
 /**
  * Individual tip item component
  */
 function TipItem({ tip, onDismiss }: { tip: SmartTip; onDismiss: (id: string) => void }) {
-  const typeStyles = {
-    info: {
-      container: "border-blue-200 bg-blue-50 dark:border-blue-800 dark:bg-blue-950/50",
-      icon: "text-blue-500 dark:text-blue-400",
-      title: "text-blue-900 dark:text-blue-100",
-      message: "text-blue-700 dark:text-blue-300",
-    },
-    warning: {
-      container: "border-amber-200 bg-amber-50 dark:border-amber-800 dark:bg-amber-950/50",
-      icon: "text-amber-500 dark:text-amber-400",
-      title: "text-amber-900 dark:text-amber-100",
-      message: "text-amber-700 dark:text-amber-300",
-    },
-    success: {
-      container: "border-green-200 bg-green-50 dark:border-green-800 dark:bg-green-950/50",
-      icon: "text-green-500 dark:text-green-400",
-      title: "text-green-900 dark:text-green-100",
-      message: "text-green-700 dark:text-green-300",
-    },
-  };
-
-  const styles = typeStyles[tip.type];
+  const styles = TIP_TYPE_STYLES[tip.type];
 
   return (
     <div
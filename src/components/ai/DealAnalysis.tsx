@@ -15,6 +15,14 @@ import {
   Target,
 } from "lucide-react";
 
+const CATEGORY_LABEL_ENTRIES = Object.entries({
+  cashflow: "Cashflow",
+  yield: "Rendite",
+  financing: "Finanzierung",
+  location: "Standort",
+  potential: "Potenzial",
+});
+
 interface DealAnalysisProps {
   input: PropertyInput;
   output: PropertyOutput;
@@ -133,13 +141,7 @@ export function DealAnalysis({ input, output }: DealAnalysisProps) {
 
           {/* Category Scores */}
           <div className="mt-6 grid grid-cols-2 gap-4 md:grid-cols-5">
-            {Object.entries({
-              cashflow: "Cashflow",
-              yield: "Rendite",
-              financing: "Finanzierung",
-              location: "Standort",
-              potential: "Potenzial",
-            }).map(([key, label]) => (
+            {CATEGORY_LABEL_ENTRIES.map(([key, label]) => (
               <div key={key} className="rounded-lg bg-[var(--surface-2)] p-3 text-center">
                 <p className="mb-1 text-xs text-[var(--muted-foreground)]">{label}</p>
                 <p
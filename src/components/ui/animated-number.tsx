@@ -127,14 +127,16 @@ function AnimatedCurrency({
   duration = 1000,
   className,
 }: AnimatedCurrencyProps) {
-  const formatCurrency = (val: number) => {
-    return new Intl.NumberFormat(locale, {
+  // Create the formatter once per locale/currency instead of once per animation frame
+  const formatCurrency = React.useMemo(() => {
+    const formatter = new Intl.NumberFormat(locale, {
       style: "currency",
       currency,
       minimumFractionDigits: 0,
       maximumFractionDigits: 0,
-    }).format(val);
-  };
+    });
+    return (val: number) => formatter.format(val);
+  }, [locale, currency]);
 
   return (
     <AnimatedNumber
@@ -21,29 +21,31 @@ export interface Preset {
   values: Partial<PropertyInput>;
 }
 
+// Bundesland abbreviations by display name, built once instead of on every lookup
+const BUNDESLAND_ABBREVIATIONS: Record<string, string> = {
+  "Mecklenburg-Vorpommern": "MV",
+  "Schleswig-Holstein": "SH",
+  Hamburg: "HH",
+  Bremen: "HB",
+  Niedersachsen: "NI",
+  "Baden-Württemberg": "BW",
+  Bayern: "BY",
+  Berlin: "BE",
+  Brandenburg: "BB",
+  Hessen: "HE",
+  "Nordrhein-Westfalen": "NW",
+  "Rheinland-Pfalz": "RP",
+  Saarland: "SL",
+  Sachsen: "SN",
+  "Sachsen-Anhalt": "ST",
+  Thüringen: "TH",
+};
+
 /**
  * Get Bundesland abbreviation for display
  */
 function getBundeslandAbbreviation(bundesland: string): string {
-  const abbreviations: Record<string, string> = {
-    "Mecklenburg-Vorpommern": "MV",
-    "Schleswig-Holstein": "SH",
-    Hamburg: "HH",
-    Bremen: "HB",
-    Niedersachsen: "NI",
-    "Baden-Württemberg": "BW",
-    Bayern: "BY",
-    Berlin: "BE",
-    Brandenburg: "BB",
-    Hessen: "HE",
-    "Nordrhein-Westfalen": "NW",
-    "Rheinland-Pfalz": "RP",
-    Saarland: "SL",
-    Sachsen: "SN",
-    "Sachsen-Anhalt": "ST",
-    Thüringen: "TH",
-  };
-  return abbreviations[bundesland] || bundesland;
+  return BUNDESLAND_ABBREVIATIONS[bundesland] || bundesland;
 }
 
 /**
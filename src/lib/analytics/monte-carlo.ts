@@ -84,7 +84,7 @@ function randomNormal(mean: number, stdDev: number): number {
 /**
  * Calculate percentile from sorted array
  */
-function percentile(sortedArray: number[], p: number): number {
+function percentile(sortedArray: ArrayLike<number>, p: number): number {
   if (sortedArray.length === 0) return 0;
 
   const index = (p / 100) * (sortedArray.length - 1);
@@ -113,12 +113,16 @@ export function runMonteCarloSimulation(input: MonteCarloInput): SimulationResul
     numberOfSimulations,
   } = input;
 
-  const simulationResults: number[][] = []; // [simulation][year]
-  const finalValues: number[] = [];
+  // One column per year holding the value of every simulation ([year][simulation]),
+  // so yearly statistics read a contiguous array instead of transposing the results
+  const yearColumns: Float64Array[] = [];
+  for (let year = 0; year <= yearsToSimulate; year++) {
+    yearColumns.push(new Float64Array(numberOfSimulations));
+  }
+  yearColumns[0].fill(initialInvestment);
 
   // Run simulations
   for (let sim = 0; sim < numberOfSimulations; sim++) {
-    const yearlyValues: number[] = [initialInvestment];
     let propertyValue = initialInvestment;
     let cumulativeCashflow = 0;
 
@@ -137,41 +141,52 @@ export function runMonteCarloSimulation(input: MonteCarloInput): SimulationResul
       );
       cumulativeCashflow += yearCashflow;
 
-      const totalValue = propertyValue + cumulativeCashflow;
-      yearlyValues.push(totalValue);
+      yearColumns[year][sim] = propertyValue + cumulativeCashflow;
     }
-
-    simulationResults.push(yearlyValues);
-    finalValues.push(yearlyValues[yearsToSimulate]);
   }
 
-  // Sort final values for percentile calculations
-  const sortedFinalValues = [...finalValues].sort((a, b) => a - b);
+  // Sort final values in place for percentile calculations; the statistics below
+  // don't depend on order, and each column is owned by this function
+  const finalValues = yearColumns[yearsToSimulate].sort();
+  const sortedFinalValues = Array.from(finalValues);
 
   // Calculate statistics
-  const mean = finalValues.reduce((a, b) => a + b, 0) / finalValues.length;
-  const variance =
-    finalValues.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / finalValues.length;
+  // Sum and probability counts are gathered in a single pass over the final values
+  let sum = 0;
+  let lossCount = 0;
+  let doubleCount = 0;
+  const doublingThreshold = initialInvestment * 2;
+  for (const value of finalValues) {
+    sum += value;
+    if (value < initialInvestment) lossCount++;
+    if (value >= doublingThreshold) doubleCount++;
+  }
+  const mean = sum / finalValues.length;
+
+  let squaredDeviationSum = 0;
+  for (const value of finalValues) {
+    squaredDeviationSum += (value - mean) * (value - mean);
+  }
+  const variance = squaredDeviationSum / finalValues.length;
   const standardDeviation = Math.sqrt(variance);
 
   // Probability metrics
-  const lossCount = finalValues.filter((v) => v < initialInvestment).length;
   const probabilityOfLoss = (lossCount / finalValues.length) * 100;
-
-  const doubleCount = finalValues.filter((v) => v >= initialInvestment * 2).length;
   const probabilityOfDoubling = (doubleCount / finalValues.length) * 100;
 
   // Calculate yearly projections
   const yearlyProjections: YearlyProjection[] = [];
   for (let year = 0; year <= yearsToSimulate; year++) {
-    const yearValues = simulationResults.map((sim) => sim[year]);
-    const sortedYearValues = [...yearValues].sort((a, b) => a - b);
+    const yearValues = yearColumns[year];
+    const yearMean = yearValues.reduce((a, b) => a + b, 0) / yearValues.length;
+    const sortedYearValues = yearValues.sort();
 
     yearlyProjections.push({
       year,
-      mean: yearValues.reduce((a, b) => a + b, 0) / yearValues.length,
-      min: Math.min(...yearValues),
-      max: Math.max(...yearValues),
+      mean: yearMean,
+      // Values are sorted, so min/max are the ends (no spread over every simulation)
+      min: sortedYearValues[0],
+      max: sortedYearValues[sortedYearValues.length - 1],
       p10: percentile(sortedYearValues, 10),
       p25: percentile(sortedYearValues, 25),
       p50: percentile(sortedYearValues, 50),
@@ -273,18 +288,32 @@ export function generateHistogramData(
   finalValues: number[],
   bins: number = 20
 ): { range: string; count: number; percentage: number }[] {
-  const min = Math.min(...finalValues);
-  const max = Math.max(...finalValues);
+  let min = Infinity;
+  let max = -Infinity;
+  for (const value of finalValues) {
+    if (value < min) min = value;
+    if (value > max) max = value;
+  }
   const binWidth = (max - min) / bins;
 
+  // Count every value into its bin in one pass instead of filtering the values per bin.
+  // Bins are [start, end), except the last one which also includes the maximum.
+  const counts = new Array<number>(bins).fill(0);
+  for (const value of finalValues) {
+    let binIndex =
+      binWidth > 0 ? Math.min(Math.floor((value - min) / binWidth), bins - 1) : bins - 1;
+    // Values on a bin edge go where the edge comparisons (not the division) put them
+    while (binIndex > 0 && value < min + binIndex * binWidth) binIndex--;
+    while (binIndex < bins - 1 && value >= min + (binIndex + 1) * binWidth) binIndex++;
+    counts[binIndex]++;
+  }
+
   const histogram: { range: string; count: number; percentage: number }[] = [];
 
   for (let i = 0; i < bins; i++) {
     const binStart = min + i * binWidth;
     const binEnd = min + (i + 1) * binWidth;
-    const count = finalValues.filter(
-      (v) => v >= binStart && (i === bins - 1 ? v <= binEnd : v < binEnd)
-    ).length;
+    const count = counts[i];
 
     histogram.push({
       range: `${(binStart / 1000).toFixed(0)}k - ${(binEnd / 1000).toFixed(0)}k`,
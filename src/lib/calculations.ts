@@ -5,7 +5,8 @@
  * following German tax and financial standards.
  */
 
-import {
+import { AfARates, BundeslandData, ReferenceRentData } from "@/types";
+import type {
   PropertyInput,
   PropertyOutput,
   SideCosts,
@@ -13,12 +14,32 @@ import {
   FinancingResult,
   CashflowResult,
   YieldMetrics,
+  YieldBatchInput,
+  YieldMetricsBatch,
   TaxResult,
   AmortizationYear,
   CumulativeCashflowPoint,
-  AfARates,
+  Property,
+  PortfolioSummary,
+  Bundesland,
+  RentIndexInput,
+  RentIndexResult,
+  BreakEvenInput,
+  BreakEvenResult,
+  RenovationInput,
+  RenovationResult,
+  ExitStrategyInput,
+  ExitStrategyResult,
+  LocationAnalysisInput,
+  LocationAnalysisResult,
+  LocationQuality,
 } from "@/types";
 
+// Property transfer tax rate (Grunderwerbsteuer) per Bundesland, flattened for direct lookup
+const PROPERTY_TRANSFER_TAX_RATES = Object.fromEntries(
+  Object.entries(BundeslandData).map(([bundesland, data]) => [bundesland, data.taxRate])
+) as Record<Bundesland, number>;
+
 // Reusable currency formatter for German locale
 const currencyFormatter = new Intl.NumberFormat("de-DE", {
   style: "currency",
@@ -27,6 +48,13 @@ const currencyFormatter = new Intl.NumberFormat("de-DE", {
   maximumFractionDigits: 0,
 });
 
+/**
+ * Get the property transfer tax rate (Grunderwerbsteuer) in percent for a Bundesland
+ */
+export function getPropertyTransferTaxRate(bundesland: Bundesland): number {
+  return PROPERTY_TRANSFER_TAX_RATES[bundesland];
+}
+
 /**
  * Calculate side costs (Nebenkosten)
  */
@@ -63,6 +91,101 @@ export function calculateInvestmentVolume(input: PropertyInput): InvestmentVolum
   };
 }
 
+/**
+ * Calculate the annual annuity payment (German: Annuität = Zins + Tilgung)
+ * The initial interest and repayment rates both apply to the original loan amount.
+ */
+export function calculateAnnuityPayment(
+  loanAmount: number,
+  interestRatePercent: number,
+  repaymentRatePercent: number
+): number {
+  return (loanAmount * (interestRatePercent + repaymentRatePercent)) / 100;
+}
+
+/**
+ * Calculate annual annuity payments for many loans at once (e.g. scenario sweeps)
+ * All inputs must have the same length; results are written into a Float64Array.
+ */
+export function calculateAnnuityPayments(
+  loanAmounts: ArrayLike<number>,
+  interestRatePercents: ArrayLike<number>,
+  repaymentRatePercents: ArrayLike<number>
+): Float64Array {
+  const payments = new Float64Array(loanAmounts.length);
+  for (let i = 0; i < payments.length; i++) {
+    payments[i] = calculateAnnuityPayment(
+      loanAmounts[i],
+      interestRatePercents[i],
+      repaymentRatePercents[i]
+    );
+  }
+  return payments;
+}
+
+/**
+ * Remaining balance of an annuity loan after a number of annual payments
+ * Closed form of the yearly recurrence: L·qⁿ − A·(qⁿ − 1) / i with q = 1 + i.
+ * Goes negative once the loan would already have been paid off.
+ */
+function remainingAnnuityBalance(
+  loanAmount: number,
+  interestRate: number,
+  annualPayment: number,
+  years: number
+): number {
+  if (interestRate === 0) return loanAmount - annualPayment * years;
+  const growth = Math.pow(1 + interestRate, years);
+  return loanAmount * growth - (annualPayment * (growth - 1)) / interestRate;
+}
+
+/**
+ * First year in which the annual payment covers the remaining balance plus interest
+ * Returns Infinity if the payment never pays the loan off.
+ */
+function calculateAnnuityPayoffYear(
+  loanAmount: number,
+  interestRate: number,
+  annualPayment: number
+): number {
+  if (interestRate === 0) {
+    return annualPayment > 0 ? Math.ceil(loanAmount / annualPayment) : Infinity;
+  }
+  if (annualPayment <= loanAmount * interestRate) return Infinity;
+
+  const payoffRatio = annualPayment / (annualPayment - loanAmount * interestRate);
+  return Math.max(1, Math.ceil(Math.log(payoffRatio) / Math.log(1 + interestRate)));
+}
+
+/**
+ * Total interest paid on an annuity loan within the given number of years
+ * Each year's interest is the payment minus its principal share, so the sum follows
+ * from the closed-form balance instead of simulating year by year. If the loan is paid
+ * off early, the final year only pays interest on the balance that was left.
+ */
+function calculateTotalAnnuityInterest(
+  loanAmount: number,
+  interestRate: number,
+  annualPayment: number,
+  years: number
+): number {
+  if (years <= 0 || interestRate === 0) return 0;
+
+  const payoffYear = calculateAnnuityPayoffYear(loanAmount, interestRate, annualPayment);
+  if (payoffYear <= years) {
+    const finalBalance = Math.max(
+      0,
+      remainingAnnuityBalance(loanAmount, interestRate, annualPayment, payoffYear - 1)
+    );
+    const principalBeforePayoff = loanAmount - finalBalance;
+    return (payoffYear - 1) * annualPayment - principalBeforePayoff + finalBalance * interestRate;
+  }
+
+  const principalPaid =
+    loanAmount - remainingAnnuityBalance(loanAmount, interestRate, annualPayment, years);
+  return years * annualPayment - principalPaid;
+}
+
 /**
  * Calculate financing details (annuity loan)
  */
@@ -82,23 +205,21 @@ export function calculateFinancing(
     };
   }
 
-  // Calculate annuity (German: Annuität = Zins + Tilgung)
-  const annuityRatePercent = interestRatePercent + repaymentRatePercent;
-  const annualPayment = (loanAmount * annuityRatePercent) / 100;
+  const annualPayment = calculateAnnuityPayment(
+    loanAmount,
+    interestRatePercent,
+    repaymentRatePercent
+  );
   const monthlyPayment = annualPayment / 12;
 
-  // Calculate total interest over loan period using amortization simulation
+  // Calculate total interest over loan period in closed form
   const interestRate = interestRatePercent / 100;
-  let remainingBalance = loanAmount;
-  let totalInterest = 0;
-
-  for (let year = 0; year < years; year++) {
-    if (remainingBalance <= 0) break;
-    const interestPayment = remainingBalance * interestRate;
-    const principalPayment = Math.min(annualPayment - interestPayment, remainingBalance);
-    totalInterest += interestPayment;
-    remainingBalance = Math.max(0, remainingBalance - principalPayment);
-  }
+  const totalInterest = calculateTotalAnnuityInterest(
+    loanAmount,
+    interestRate,
+    annualPayment,
+    years
+  );
 
   const totalCost = loanAmount + totalInterest;
 
@@ -184,6 +305,13 @@ export function calculateCashflow(
   };
 }
 
+/**
+ * Express a value as a percentage of a base, or 0 if the base is not positive
+ */
+function percentOf(value: number, base: number): number {
+  return base > 0 ? (value / base) * 100 : 0;
+}
+
 /**
  * Calculate yield metrics
  */
@@ -196,21 +324,19 @@ export function calculateYields(
   const equity = input.equity;
 
   // Gross rental yield: Annual rent / Purchase price
-  const grossRentalYield =
-    purchasePrice > 0 ? (cashflow.grossRentalIncome / purchasePrice) * 100 : 0;
+  const grossRentalYield = percentOf(cashflow.grossRentalIncome, purchasePrice);
 
   // Net rental yield: (Net rent - operating costs) / Total investment
-  const netRentalYield =
-    totalInvestment > 0
-      ? ((cashflow.netRentalIncome - cashflow.operatingCosts) / totalInvestment) * 100
-      : 0;
+  const netRentalYield = percentOf(
+    cashflow.netRentalIncome - cashflow.operatingCosts,
+    totalInvestment
+  );
 
   // Return on equity: Cashflow after tax / Equity
-  const returnOnEquity = equity > 0 ? (cashflow.cashflowAfterTax / equity) * 100 : 0;
+  const returnOnEquity = percentOf(cashflow.cashflowAfterTax, equity);
 
   // Cashflow yield: Cashflow after tax / Total investment
-  const cashflowYield =
-    totalInvestment > 0 ? (cashflow.cashflowAfterTax / totalInvestment) * 100 : 0;
+  const cashflowYield = percentOf(cashflow.cashflowAfterTax, totalInvestment);
 
   // Object yield (same as net rental yield for simplicity)
   const objectYield = netRentalYield;
@@ -225,20 +351,97 @@ export function calculateYields(
 }
 
 /**
- * Generate amortization schedule
+ * Calculate yield metrics for many properties or scenarios at once
+ * Same formulas and zero guards as calculateYields, applied column-wise into Float64Arrays.
  */
-export function generateAmortizationSchedule(
+export function calculateYieldsBatch(input: YieldBatchInput): YieldMetricsBatch {
+  const count = input.purchasePrice.length;
+  const grossRentalYield = new Float64Array(count);
+  const netRentalYield = new Float64Array(count);
+  const returnOnEquity = new Float64Array(count);
+  const cashflowYield = new Float64Array(count);
+
+  for (let i = 0; i < count; i++) {
+    const purchasePrice = input.purchasePrice[i];
+    const totalInvestment = input.totalInvestment[i];
+    const equity = input.equity[i];
+    const cashflowAfterTax = input.cashflowAfterTax[i];
+
+    grossRentalYield[i] = percentOf(input.grossRentalIncome[i], purchasePrice);
+    netRentalYield[i] = percentOf(
+      input.netRentalIncome[i] - input.operatingCosts[i],
+      totalInvestment
+    );
+    returnOnEquity[i] = percentOf(cashflowAfterTax, equity);
+    cashflowYield[i] = percentOf(cashflowAfterTax, totalInvestment);
+  }
+
+  return {
+    grossRentalYield,
+    netRentalYield,
+    returnOnEquity,
+    cashflowYield,
+    // Object yield (same as net rental yield for simplicity)
+    objectYield: netRentalYield.slice(),
+  };
+}
+
+interface CumulativeCashflowProjection {
+  purchasePrice: number;
+  annualCashflow: number;
+  annualAppreciationPercent: number;
+}
+
+interface AmortizationPlan {
+  amortizationSchedule: AmortizationYear[];
+  cumulativeCashflow: CumulativeCashflowPoint[];
+}
+
+/**
+ * Project property value, debt and cumulative cashflow for one schedule year
+ * Computed in closed form from the year offset, so no running totals are carried.
+ */
+function toCumulativeCashflowPoint(
+  yearData: AmortizationYear,
+  yearsElapsed: number,
+  projection: CumulativeCashflowProjection
+): CumulativeCashflowPoint {
+  const appreciationRate = 1 + projection.annualAppreciationPercent / 100;
+  const propertyValue = projection.purchasePrice * Math.pow(appreciationRate, yearsElapsed);
+  const cumulativeCashflow = projection.annualCashflow * yearsElapsed;
+  const remainingDebt = yearData.endingBalance;
+  const netWorth = propertyValue - remainingDebt + cumulativeCashflow;
+
+  return {
+    year: yearData.year,
+    cumulativeCashflow,
+    propertyValue,
+    remainingDebt,
+    netWorth,
+  };
+}
+
+/**
+ * Build the amortization schedule and, if requested, the cumulative cashflow
+ * projection in a single pass over the loan years
+ */
+function buildAmortizationPlan(
   loanAmount: number,
   interestRatePercent: number,
   repaymentRatePercent: number,
-  years: number
-): AmortizationYear[] {
-  if (loanAmount <= 0) return [];
-
+  years: number,
+  projection?: CumulativeCashflowProjection
+): AmortizationPlan {
   const schedule: AmortizationYear[] = [];
+  const points: CumulativeCashflowPoint[] = [];
+  if (loanAmount <= 0) return { amortizationSchedule: schedule, cumulativeCashflow: points };
+
   const interestRate = interestRatePercent / 100;
-  const annuityRatePercent = interestRatePercent + repaymentRatePercent;
-  const annualPayment = (loanAmount * annuityRatePercent) / 100;
+  const annualPayment = calculateAnnuityPayment(
+    loanAmount,
+    interestRatePercent,
+    repaymentRatePercent
+  );
 
   let remainingBalance = loanAmount;
   let cumulativeInterest = 0;
@@ -255,7 +458,7 @@ export function generateAmortizationSchedule(
     cumulativeInterest += interestPayment;
     cumulativePrincipal += principalPayment;
 
-    schedule.push({
+    const yearData: AmortizationYear = {
       year,
       startingBalance,
       interestPayment,
@@ -263,10 +466,68 @@ export function generateAmortizationSchedule(
       endingBalance: remainingBalance,
       cumulativeInterest,
       cumulativePrincipal,
-    });
+    };
+    schedule.push(yearData);
+
+    if (projection) {
+      points.push(toCumulativeCashflowPoint(yearData, year, projection));
+    }
+  }
+
+  return { amortizationSchedule: schedule, cumulativeCashflow: points };
+}
+
+/**
+ * Generate amortization schedule
+ */
+export function generateAmortizationSchedule(
+  loanAmount: number,
+  interestRatePercent: number,
+  repaymentRatePercent: number,
+  years: number
+): AmortizationYear[] {
+  const { amortizationSchedule } = buildAmortizationPlan(
+    loanAmount,
+    interestRatePercent,
+    repaymentRatePercent,
+    years
+  );
+  return amortizationSchedule;
+}
+
+/**
+ * Calculate the remaining balance at the end of each year for many loans at once
+ * Returns a row-major matrix with one row of `years` balances per loan (row k starts at
+ * k * years). Values match the endingBalance of generateAmortizationSchedule and stay 0
+ * once a loan is paid off.
+ */
+export function calculateRemainingBalances(
+  loanAmounts: ArrayLike<number>,
+  interestRatePercents: ArrayLike<number>,
+  repaymentRatePercents: ArrayLike<number>,
+  years: number
+): Float64Array {
+  const balances = new Float64Array(loanAmounts.length * years);
+
+  for (let loan = 0; loan < loanAmounts.length; loan++) {
+    const interestRate = interestRatePercents[loan] / 100;
+    const annualPayment = calculateAnnuityPayment(
+      loanAmounts[loan],
+      interestRatePercents[loan],
+      repaymentRatePercents[loan]
+    );
+    const rowOffset = loan * years;
+
+    let remainingBalance = loanAmounts[loan];
+    for (let year = 0; year < years && remainingBalance > 0; year++) {
+      const interestPayment = remainingBalance * interestRate;
+      const principalPayment = Math.min(annualPayment - interestPayment, remainingBalance);
+      remainingBalance = Math.max(0, remainingBalance - principalPayment);
+      balances[rowOffset + year] = remainingBalance;
+    }
   }
 
-  return schedule;
+  return balances;
 }
 
 /**
@@ -274,33 +535,14 @@ export function generateAmortizationSchedule(
  */
 export function calculateCumulativeCashflow(
   purchasePrice: number,
-  amortizationSchedule: AmortizationYear[],
+  amortizationSchedule: readonly AmortizationYear[],
   annualCashflow: number,
   annualAppreciationPercent: number = 2.0
 ): CumulativeCashflowPoint[] {
-  if (amortizationSchedule.length === 0) return [];
-
-  const points: CumulativeCashflowPoint[] = [];
-  let cumulativeCashflow = 0;
-  let propertyValue = purchasePrice;
-  const appreciationRate = 1 + annualAppreciationPercent / 100;
-
-  for (const yearData of amortizationSchedule) {
-    propertyValue *= appreciationRate;
-    cumulativeCashflow += annualCashflow;
-    const remainingDebt = yearData.endingBalance;
-    const netWorth = propertyValue - remainingDebt + cumulativeCashflow;
-
-    points.push({
-      year: yearData.year,
-      cumulativeCashflow,
-      propertyValue,
-      remainingDebt,
-      netWorth,
-    });
-  }
-
-  return points;
+  const projection = { purchasePrice, annualCashflow, annualAppreciationPercent };
+  return amortizationSchedule.map((yearData, index) =>
+    toCumulativeCashflowPoint(yearData, index + 1, projection)
+  );
 }
 
 /**
@@ -322,36 +564,36 @@ export function calculatePropertyKPIs(input: PropertyInput): PropertyOutput {
     input.fixedInterestPeriod
   );
 
-  // 4. Generate amortization schedule
-  const amortizationSchedule = generateAmortizationSchedule(
-    loanAmount,
-    input.interestRate,
-    input.repaymentRate,
-    input.fixedInterestPeriod
+  // 4. Calculate average interest for tax calculation
+  // Total interest is known in closed form, so only the number of years the loan runs
+  // within the period is needed (it may be paid off early)
+  const interestYears = Math.min(
+    input.fixedInterestPeriod,
+    calculateAnnuityPayoffYear(loanAmount, input.interestRate / 100, financing.annualPayment)
   );
-
-  // 5. Calculate average interest for tax calculation
   const averageAnnualInterest =
-    amortizationSchedule.length > 0
-      ? amortizationSchedule.reduce((sum, year) => sum + year.interestPayment, 0) /
-        amortizationSchedule.length
-      : 0;
+    loanAmount > 0 && interestYears > 0 ? financing.totalInterest / interestYears : 0;
 
-  // 6. Calculate tax effects
+  // 5. Calculate tax effects
   const tax = calculateTax(input, averageAnnualInterest);
 
-  // 7. Calculate cashflow
+  // 6. Calculate cashflow
   const cashflow = calculateCashflow(input, financing, tax);
 
-  // 8. Calculate yields
+  // 7. Calculate yields
   const yields = calculateYields(input, investmentVolume, cashflow);
 
-  // 9. Calculate cumulative cashflow projection
-  const cumulativeCashflow = calculateCumulativeCashflow(
-    input.purchasePrice,
-    amortizationSchedule,
-    cashflow.cashflowAfterTax,
-    input.expectedAppreciationPercent
+  // 8. Generate amortization schedule and cumulative cashflow projection in one pass
+  const { amortizationSchedule, cumulativeCashflow } = buildAmortizationPlan(
+    loanAmount,
+    input.interestRate,
+    input.repaymentRate,
+    input.fixedInterestPeriod,
+    {
+      purchasePrice: input.purchasePrice,
+      annualCashflow: cashflow.cashflowAfterTax,
+      annualAppreciationPercent: input.expectedAppreciationPercent,
+    }
   );
 
   return {
@@ -365,6 +607,67 @@ export function calculatePropertyKPIs(input: PropertyInput): PropertyOutput {
   };
 }
 
+// Outputs keyed by input object. Cached inputs are read-only: a changed input is a new
+// object, so an object identity always stands for the same values and its output can be shared.
+const propertyKPICache = new WeakMap<Readonly<PropertyInput>, PropertyOutput>();
+
+/**
+ * Calculate all KPIs for a property, reusing the result for an input already calculated
+ * The store and several components calculate the same current input on every change.
+ * The input must not be mutated afterwards; pass an updated copy instead.
+ */
+export function calculatePropertyKPIsCached(input: Readonly<PropertyInput>): PropertyOutput {
+  let output = propertyKPICache.get(input);
+  if (!output) {
+    output = calculatePropertyKPIs(input);
+    propertyKPICache.set(input, output);
+  }
+  return output;
+}
+
+/**
+ * Aggregate saved properties into portfolio totals
+ * Properties without a stored output are calculated from their input.
+ */
+export function calculatePortfolioSummary(properties: readonly Property[]): PortfolioSummary {
+  if (properties.length === 0) {
+    return {
+      totalProperties: 0,
+      totalInvestment: 0,
+      totalEquity: 0,
+      totalDebt: 0,
+      totalMonthlyCashflow: 0,
+      totalAnnualCashflow: 0,
+      averageYield: 0,
+    };
+  }
+
+  let totalInvestment = 0;
+  let totalEquity = 0;
+  let totalMonthlyCashflow = 0;
+  let totalAnnualCashflow = 0;
+  let yieldSum = 0;
+
+  for (const property of properties) {
+    const output = property.output || calculatePropertyKPIsCached(property.input);
+    totalInvestment += output.investmentVolume.totalInvestment;
+    totalEquity += property.input.equity;
+    totalMonthlyCashflow += output.cashflow.monthlyCashflowAfterTax;
+    totalAnnualCashflow += output.cashflow.cashflowAfterTax;
+    yieldSum += output.yields.grossRentalYield;
+  }
+
+  return {
+    totalProperties: properties.length,
+    totalInvestment,
+    totalEquity,
+    totalDebt: totalInvestment - totalEquity,
+    totalMonthlyCashflow,
+    totalAnnualCashflow,
+    averageYield: yieldSum / properties.length,
+  };
+}
+
 /**
  * Get default property input values
  */
@@ -374,7 +677,7 @@ export function getDefaultPropertyInput(): PropertyInput {
     purchasePrice: 300000,
     brokerPercent: 3.57,
     notaryPercent: 2.0,
-    propertyTransferTaxPercent: 3.5, // Bayern
+    propertyTransferTaxPercent: getPropertyTransferTaxRate("BAYERN"),
     renovationCosts: 0,
 
     // Family Purchase
@@ -413,21 +716,6 @@ export function getDefaultPropertyInput(): PropertyInput {
 // New Calculation Functions for Enhanced Features
 // ============================================
 
-import {
-  RentIndexInput,
-  RentIndexResult,
-  ReferenceRentData,
-  BreakEvenInput,
-  BreakEvenResult,
-  RenovationInput,
-  RenovationResult,
-  ExitStrategyInput,
-  ExitStrategyResult,
-  LocationAnalysisInput,
-  LocationAnalysisResult,
-  LocationQuality,
-} from "@/types";
-
 /**
  * Calculate rent index comparison (Mietpreisspiegel)
  */
@@ -20,6 +20,9 @@ export interface SheetData {
   rows: (string | number)[][];
 }
 
+// Reusable number formatter for German locale (same output as toLocaleString("de-DE"))
+const numberFormatter = new Intl.NumberFormat("de-DE");
+
 /**
  * Generate overview sheet data
  */
@@ -79,7 +82,7 @@ function generateOverviewSheet(data: ExcelExportData): SheetData {
 /**
  * Generate amortization schedule sheet
  */
-function generateAmortizationSheet(schedule: AmortizationYear[]): SheetData {
+function generateAmortizationSheet(schedule: readonly AmortizationYear[]): SheetData {
   return {
     name: "Tilgungsplan",
     headers: [
@@ -162,7 +165,7 @@ export function sheetToCSV(sheet: SheetData): string {
   for (const row of sheet.rows) {
     const formattedRow = row.map((cell) => {
       if (typeof cell === "number") {
-        return cell.toLocaleString("de-DE");
+        return numberFormatter.format(cell);
       }
       // Escape quotes and wrap in quotes if contains semicolon
       const cellStr = String(cell);
@@ -1,4 +1,4 @@
-import { useEffect } from "react";
+import { useCallback, useEffect, useSyncExternalStore } from "react";
 
 /**
  * Custom hook to lock body scroll when component is mounted
@@ -20,3 +20,23 @@ export function useBodyScrollLock(enabled = true) {
     };
   }, [enabled]);
 }
+
+/**
+ * Custom hook to track whether a CSS media query currently matches.
+ * Returns null during server rendering and hydration, so server and first client render agree.
+ *
+ * @param query - Media query to evaluate, e.g. "(min-width: 768px)"
+ */
+export function useMediaQuery(query: string): boolean | null {
+  const subscribe = useCallback(
+    (onChange: () => void) => {
+      const mediaQuery = window.matchMedia(query);
+      mediaQuery.addEventListener("change", onChange);
+      return () => mediaQuery.removeEventListener("change", onChange);
+    },
+    [query]
+  );
+
+  // useSyncExternalStore reads the match without setting state in an effect
+  return useSyncExternalStore(subscribe, () => window.matchMedia(query).matches, () => null);
+}
@@ -5,7 +5,7 @@
  */
 
 import { create } from "zustand";
-import { persist } from "zustand/middleware";
+import { persist, type PersistStorage } from "zustand/middleware";
 import {
   PropertyInput,
   PropertyOutput,
@@ -14,7 +14,11 @@ import {
   PortfolioSummary,
   AfAType,
 } from "@/types";
-import { calculatePropertyKPIs, getDefaultPropertyInput } from "@/lib/calculations";
+import {
+  calculatePortfolioSummary,
+  calculatePropertyKPIsCached,
+  getDefaultPropertyInput,
+} from "@/lib/calculations";
 
 /**
  * Generate a UUID that works in all environments
@@ -49,9 +53,76 @@ async function handleSyncError(
   }
 }
 
+// Side-cost defaults restored when a family purchase is toggled off without saved values
+const {
+  propertyTransferTaxPercent: DEFAULT_PROPERTY_TRANSFER_TAX_PERCENT,
+  brokerPercent: DEFAULT_BROKER_PERCENT,
+} = getDefaultPropertyInput();
+
+type PersistedState = Pick<ImmoCalcState, "properties" | "currentInput">;
+
+// Serialized saved properties, reused until the properties array is replaced
+let cachedProperties: Property[] | null = null;
+let cachedPropertiesJSON = "[]";
+
+/**
+ * Browser localStorage, or null on the server or when storage access is blocked
+ * (e.g. site data disabled). Like zustand's createJSONStorage, persistence is then skipped
+ * instead of throwing from every state update.
+ */
+function getLocalStorage(): Storage | null {
+  if (typeof window === "undefined") return null;
+  try {
+    return window.localStorage;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * localStorage adapter for the persisted state.
+ * Persist writes on every state change (e.g. each input keystroke), but saved
+ * properties rarely change, so their JSON is cached and only the rest is re-serialized.
+ * The output is identical to JSON.stringify of the whole value.
+ */
+export const persistStorage: PersistStorage<PersistedState> = {
+  getItem: (name) => {
+    const storage = getLocalStorage();
+    if (!storage) return null;
+    const str = storage.getItem(name);
+    return str ? JSON.parse(str) : null;
+  },
+  setItem: (name, value) => {
+    const storage = getLocalStorage();
+    if (!storage) return;
+    const stateFields: string[] = [];
+    for (const [key, fieldValue] of Object.entries(value.state)) {
+      let fieldJSON: string | undefined;
+      if (key === "properties") {
+        const { properties } = value.state;
+        if (properties !== cachedProperties) {
+          cachedPropertiesJSON = JSON.stringify(properties);
+          cachedProperties = properties;
+        }
+        fieldJSON = cachedPropertiesJSON;
+      } else {
+        fieldJSON = JSON.stringify(fieldValue);
+      }
+      // Skip fields JSON.stringify would omit (undefined)
+      if (fieldJSON !== undefined) stateFields.push(`${JSON.stringify(key)}:${fieldJSON}`);
+    }
+    const versionJSON =
+      value.version === undefined ? "" : `,"version":${JSON.stringify(value.version)}`;
+    storage.setItem(name, `{"state":{${stateFields.join(",")}}${versionJSON}}`);
+  },
+  removeItem: (name) => {
+    getLocalStorage()?.removeItem(name);
+  },
+};
+
 interface ImmoCalcState {
   // Current calculator input
-  currentInput: PropertyInput;
+  currentInput: Readonly<PropertyInput>;
   currentOutput: PropertyOutput | null;
 
   // Saved properties (stored in localStorage for demo, would be in DB)
@@ -119,38 +190,43 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
       // Update input and recalculate
       updateInput: (updates) => {
         set((state) => {
-          let newInput = { ...state.currentInput, ...updates };
+          // Skip recalculation (and subscriber updates) when no value actually changes,
+          // e.g. a field re-emitting the same number while another input is edited
+          const isUnchanged = (Object.keys(updates) as (keyof PropertyInput)[]).every((key) =>
+            Object.is(state.currentInput[key], updates[key])
+          );
+          if (isUnchanged && state.currentOutput) {
+            return state;
+          }
+
           let preFamilyPurchaseTaxPercent = state.preFamilyPurchaseTaxPercent;
           let preFamilyPurchaseBrokerPercent = state.preFamilyPurchaseBrokerPercent;
+          let familyPurchaseOverrides: Partial<PropertyInput> | null = null;
 
           // If family purchase is toggled ON, store current values and set tax and broker to 0
           if (updates.isFamilyPurchase === true) {
             preFamilyPurchaseTaxPercent = state.currentInput.propertyTransferTaxPercent;
             preFamilyPurchaseBrokerPercent = state.currentInput.brokerPercent;
-            newInput = {
-              ...newInput,
-              propertyTransferTaxPercent: 0,
-              brokerPercent: 0,
-            };
+            familyPurchaseOverrides = { propertyTransferTaxPercent: 0, brokerPercent: 0 };
           }
 
           // If family purchase is toggled OFF, restore previous values or defaults
           if (updates.isFamilyPurchase === false) {
-            const defaultInput = getDefaultPropertyInput();
-            newInput = {
-              ...newInput,
+            familyPurchaseOverrides = {
               propertyTransferTaxPercent:
-                preFamilyPurchaseTaxPercent ?? defaultInput.propertyTransferTaxPercent,
-              brokerPercent: preFamilyPurchaseBrokerPercent ?? defaultInput.brokerPercent,
+                preFamilyPurchaseTaxPercent ?? DEFAULT_PROPERTY_TRANSFER_TAX_PERCENT,
+              brokerPercent: preFamilyPurchaseBrokerPercent ?? DEFAULT_BROKER_PERCENT,
             };
             // Clear the stored values
             preFamilyPurchaseTaxPercent = null;
             preFamilyPurchaseBrokerPercent = null;
           }
 
+          const newInput = { ...state.currentInput, ...updates, ...familyPurchaseOverrides };
+
           return {
             currentInput: newInput,
-            currentOutput: calculatePropertyKPIs(newInput),
+            currentOutput: calculatePropertyKPIsCached(newInput),
             preFamilyPurchaseTaxPercent,
             preFamilyPurchaseBrokerPercent,
           };
@@ -162,7 +238,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
         const defaultInput = getDefaultPropertyInput();
         set({
           currentInput: defaultInput,
-          currentOutput: calculatePropertyKPIs(defaultInput),
+          currentOutput: calculatePropertyKPIsCached(defaultInput),
           selectedPropertyId: null,
         });
       },
@@ -206,7 +282,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
       calculate: () => {
         set((state) => ({
           isCalculating: true,
-          currentOutput: calculatePropertyKPIs(state.currentInput),
+          currentOutput: calculatePropertyKPIsCached(state.currentInput),
         }));
         // Small delay to show loading state
         setTimeout(() => set({ isCalculating: false }), 100);
@@ -215,7 +291,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
       // Save current input as a property
       saveProperty: async (name, address) => {
         const state = get();
-        const output = calculatePropertyKPIs(state.currentInput);
+        const output = calculatePropertyKPIsCached(state.currentInput);
 
         const newProperty: Property = {
           id: generateId(),
@@ -256,7 +332,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
         if (property) {
           set({
             currentInput: { ...property.input },
-            currentOutput: property.output || calculatePropertyKPIs(property.input),
+            currentOutput: property.output || calculatePropertyKPIsCached(property.input),
             selectedPropertyId: id,
           });
         }
@@ -290,7 +366,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
       // Add a new scenario for comparison
       addScenario: (name) => {
         const state = get();
-        const output = calculatePropertyKPIs(state.currentInput);
+        const output = calculatePropertyKPIsCached(state.currentInput);
 
         const newScenario: Scenario = {
           id: generateId(),
@@ -313,7 +389,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
               return {
                 ...s,
                 input: newInput,
-                output: calculatePropertyKPIs(newInput),
+                output: calculatePropertyKPIsCached(newInput),
               };
             }
             return s;
@@ -339,46 +415,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
       },
 
       // Get portfolio summary
-      getPortfolioSummary: () => {
-        const properties = get().properties;
-
-        if (properties.length === 0) {
-          return {
-            totalProperties: 0,
-            totalInvestment: 0,
-            totalEquity: 0,
-            totalDebt: 0,
-            totalMonthlyCashflow: 0,
-            totalAnnualCashflow: 0,
-            averageYield: 0,
-          };
-        }
-
-        let totalInvestment = 0;
-        let totalEquity = 0;
-        let totalMonthlyCashflow = 0;
-        let totalAnnualCashflow = 0;
-        let yieldSum = 0;
-
-        for (const property of properties) {
-          const output = property.output || calculatePropertyKPIs(property.input);
-          totalInvestment += output.investmentVolume.totalInvestment;
-          totalEquity += property.input.equity;
-          totalMonthlyCashflow += output.cashflow.monthlyCashflowAfterTax;
-          totalAnnualCashflow += output.cashflow.cashflowAfterTax;
-          yieldSum += output.yields.grossRentalYield;
-        }
-
-        return {
-          totalProperties: properties.length,
-          totalInvestment,
-          totalEquity,
-          totalDebt: totalInvestment - totalEquity,
-          totalMonthlyCashflow,
-          totalAnnualCashflow,
-          averageYield: yieldSum / properties.length,
-        };
-      },
+      getPortfolioSummary: () => calculatePortfolioSummary(get().properties),
 
       // Sync portfolio with server
       syncWithServer: async () => {
@@ -428,6 +465,7 @@ export const useImmoCalcStore = create<ImmoCalcState>()(
     }),
     {
       name: "immocalc-storage",
+      storage: persistStorage,
       partialize: (state) => ({
         properties: state.properties,
         currentInput: state.currentInput,
@@ -100,109 +100,127 @@ export interface PropertyInput {
  * Side costs breakdown
  */
 export interface SideCosts {
-  brokerCost: number;
-  notaryCost: number;
-  propertyTransferTax: number;
-  renovationCosts: number;
-  totalSideCosts: number;
-  totalSideCostsPercent: number;
+  readonly brokerCost: number;
+  readonly notaryCost: number;
+  readonly propertyTransferTax: number;
+  readonly renovationCosts: number;
+  readonly totalSideCosts: number;
+  readonly totalSideCostsPercent: number;
 }
 
 /**
  * Investment volume calculation
  */
 export interface InvestmentVolume {
-  purchasePrice: number;
-  sideCosts: SideCosts;
-  totalInvestment: number;
+  readonly purchasePrice: number;
+  readonly sideCosts: SideCosts;
+  readonly totalInvestment: number;
 }
 
 /**
  * Financing calculation result
  */
 export interface FinancingResult {
-  loanAmount: number;
-  monthlyPayment: number;
-  annualPayment: number;
-  totalCost: number;
-  totalInterest: number;
+  readonly loanAmount: number;
+  readonly monthlyPayment: number;
+  readonly annualPayment: number;
+  readonly totalCost: number;
+  readonly totalInterest: number;
 }
 
 /**
  * Cashflow calculation result
  */
 export interface CashflowResult {
-  grossRentalIncome: number;
-  vacancyDeduction: number;
-  netRentalIncome: number;
-  operatingCosts: number;
-  annualDebtService: number;
-  cashflowBeforeTax: number;
-  taxEffect: number;
-  cashflowAfterTax: number;
-  monthlyCashflowBeforeTax: number;
-  monthlyCashflowAfterTax: number;
+  readonly grossRentalIncome: number;
+  readonly vacancyDeduction: number;
+  readonly netRentalIncome: number;
+  readonly operatingCosts: number;
+  readonly annualDebtService: number;
+  readonly cashflowBeforeTax: number;
+  readonly taxEffect: number;
+  readonly cashflowAfterTax: number;
+  readonly monthlyCashflowBeforeTax: number;
+  readonly monthlyCashflowAfterTax: number;
 }
 
 /**
  * Yield metrics calculation result
  */
 export interface YieldMetrics {
-  grossRentalYield: number;
-  netRentalYield: number;
-  returnOnEquity: number;
-  cashflowYield: number;
-  objectYield: number;
+  readonly grossRentalYield: number;
+  readonly netRentalYield: number;
+  readonly returnOnEquity: number;
+  readonly cashflowYield: number;
+  readonly objectYield: number;
+}
+
+/**
+ * Column inputs for batch yield calculation (one entry per property/scenario)
+ */
+export interface YieldBatchInput {
+  purchasePrice: ArrayLike<number>;
+  totalInvestment: ArrayLike<number>;
+  equity: ArrayLike<number>;
+  grossRentalIncome: ArrayLike<number>;
+  netRentalIncome: ArrayLike<number>;
+  operatingCosts: ArrayLike<number>;
+  cashflowAfterTax: ArrayLike<number>;
 }
 
+/**
+ * Batch yield calculation result: one column per yield metric
+ */
+export type YieldMetricsBatch = Record<keyof YieldMetrics, Float64Array>;
+
 /**
  * Tax calculation result
  */
 export interface TaxResult {
-  afaAmount: number;
-  deductibleInterest: number;
-  deductibleCosts: number;
-  totalDeductions: number;
-  rentalIncomeAfterDeductions: number;
-  taxEffect: number;
-  monthlyTaxEffect: number;
+  readonly afaAmount: number;
+  readonly deductibleInterest: number;
+  readonly deductibleCosts: number;
+  readonly totalDeductions: number;
+  readonly rentalIncomeAfterDeductions: number;
+  readonly taxEffect: number;
+  readonly monthlyTaxEffect: number;
 }
 
 /**
  * Single year in amortization schedule
  */
 export interface AmortizationYear {
-  year: number;
-  startingBalance: number;
-  interestPayment: number;
-  principalPayment: number;
-  endingBalance: number;
-  cumulativeInterest: number;
-  cumulativePrincipal: number;
+  readonly year: number;
+  readonly startingBalance: number;
+  readonly interestPayment: number;
+  readonly principalPayment: number;
+  readonly endingBalance: number;
+  readonly cumulativeInterest: number;
+  readonly cumulativePrincipal: number;
 }
 
 /**
  * Cumulative cashflow data point
  */
 export interface CumulativeCashflowPoint {
-  year: number;
-  cumulativeCashflow: number;
-  propertyValue: number;
-  remainingDebt: number;
-  netWorth: number;
+  readonly year: number;
+  readonly cumulativeCashflow: number;
+  readonly propertyValue: number;
+  readonly remainingDebt: number;
+  readonly netWorth: number;
 }
 
 /**
  * Complete property calculation output
  */
 export interface PropertyOutput {
-  investmentVolume: InvestmentVolume;
-  financing: FinancingResult;
-  cashflow: CashflowResult;
-  yields: YieldMetrics;
-  tax: TaxResult;
-  amortizationSchedule: AmortizationYear[];
-  cumulativeCashflow: CumulativeCashflowPoint[];
+  readonly investmentVolume: InvestmentVolume;
+  readonly financing: FinancingResult;
+  readonly cashflow: CashflowResult;
+  readonly yields: YieldMetrics;
+  readonly tax: TaxResult;
+  readonly amortizationSchedule: readonly AmortizationYear[];
+  readonly cumulativeCashflow: readonly CumulativeCashflowPoint[];
 }
 
 /**